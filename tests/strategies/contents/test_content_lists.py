@@ -85,8 +85,7 @@ def test_properties(data: st.DataObject) -> None:
 
     match opts.kwargs.get('st_content'):
         case RecordCallDraws() as st_content:
-            assert len(st_content.drawn) == len(result)
-            assert all(d is r for d, r in zip(st_content.drawn, result))
+            assert all(d is r for d, r in zip(st_content.drawn, result, strict=True))
 
 
 def test_draw_min_len() -> None:
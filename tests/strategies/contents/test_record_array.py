@@ -11,6 +11,8 @@ from tests.find_settings import FIND
 
 DEFAULT_MAX_FIELDS = 5
 
+_CONTENT = st_ak.contents.contents(max_leaf_size=5, max_depth=2)
+
 
 class RecordArrayContentsKwargs(TypedDict, total=False):
     """Options for `record_array_contents()` strategy."""
@@ -28,9 +30,10 @@ def _contents_list(
 ) -> list[Content]:
     """Draw a list of 1..5 Content objects for testing."""
     n = draw(st.integers(min_value=1, max_value=5))
-    return [
-        draw(st_ak.contents.contents(max_leaf_size=5, max_depth=2)) for _ in range(n)
-    ]
+    return [draw(_CONTENT) for _ in range(n)]
+
+
+_CONTENTS_LIST = _contents_list()
 
 
 @st.composite
@@ -41,7 +44,7 @@ def record_array_contents_kwargs(
     """Strategy for options for `record_array_contents()` strategy."""
     if chain is None:
         chain = st_ak.OptsChain({})
-    st_contents = chain.register(_contents_list())
+    st_contents = chain.register(_CONTENTS_LIST)
 
     min_length, max_length = draw(st_ak.ranges(min_start=0, max_end=5))
 
@@ -55,7 +58,7 @@ def record_array_contents_kwargs(
             {k: st.just(v) for k, v in drawn if v is not None},
             optional={
                 'contents': st.one_of(
-                    _contents_list(),
+                    _CONTENTS_LIST,
                     st.just(st_contents),
                 ),
                 'max_fields': st.integers(min_value=0, max_value=10),
@@ -108,8 +111,9 @@ def test_properties(data: st.DataObject) -> None:
 
     # Named records have unique field names matching the number of contents
     if not result.is_tuple:
-        assert len(result.fields) == len(result.contents)
-        assert len(set(result.fields)) == len(result.fields)
+        fields = result.fields
+        assert len(fields) == len(result.contents)
+        assert len(set(fields)) == len(fields)
 
     # Assert length is within bounds
     min_length = opts.kwargs.get('min_length', 0)
@@ -118,7 +122,7 @@ def test_properties(data: st.DataObject) -> None:
 
     # Non-empty records: length equals the minimum content length, capped by max_length
     if result.contents:
-        expected = min(len(c) for c in result.contents)
+        expected = min(map(len, result.contents))
         if max_length is not None:
             expected = min(expected, max_length)
         assert result.length == expected
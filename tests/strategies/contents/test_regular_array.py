@@ -10,6 +10,8 @@ from hypothesis_awkward import strategies as st_ak
 from hypothesis_awkward.util import safe_compare as sc
 from tests.find_settings import FIND, FIND_NO_SHRINK
 
+_CONTENTS = st_ak.contents.contents()
+
 
 class RegularArrayContentsKwargs(TypedDict, total=False):
     """Options for `regular_array_contents()` strategy."""
@@ -29,7 +31,7 @@ def regular_array_contents_kwargs(
     """Strategy for options for `regular_array_contents()` strategy."""
     if chain is None:
         chain = st_ak.OptsChain({})
-    st_content = chain.register(st_ak.contents.contents())
+    st_content = chain.register(_CONTENTS)
 
     min_length, max_length = draw(st_ak.ranges(min_start=0, max_end=20))
 
@@ -43,7 +45,7 @@ def regular_array_contents_kwargs(
             {k: st.just(v) for k, v in drawn if v is not None},
             optional={
                 'content': st.one_of(
-                    st_ak.contents.contents(),
+                    _CONTENTS,
                     st.just(st_content),
                 ),
                 'max_size': st.integers(min_value=0, max_value=50),
@@ -7,12 +7,20 @@ from hypothesis import strategies as st
 
 from awkward.contents import Content, UnionArray
 from hypothesis_awkward import strategies as st_ak
-from hypothesis_awkward.util import iter_contents
+from hypothesis_awkward.util import get_contents, iter_contents
 from hypothesis_awkward.util import safe_compare as sc
 from tests.find_settings import FIND, FIND_RARE_NO_SHRINK
 
 DEFAULT_MAX_CONTENTS = 4
 
+_CONTENT = st_ak.contents.contents(
+    max_leaf_size=5,
+    max_depth=2,
+    allow_union=False,
+    allow_option_root=False,
+    allow_indexed_root=False,
+)
+
 
 class UnionArrayContentsKwargs(TypedDict, total=False):
     """Options for `union_array_contents()` strategy."""
@@ -29,18 +37,10 @@ def _contents_list(
 ) -> list[Content]:
     """Draw a list of 2..5 Content objects for testing."""
     n = draw(st.integers(min_value=2, max_value=5))
-    return [
-        draw(
-            st_ak.contents.contents(
-                max_leaf_size=5,
-                max_depth=2,
-                allow_union=False,
-                allow_option_root=False,
-                allow_indexed_root=False,
-            )
-        )
-        for _ in range(n)
-    ]
+    return [draw(_CONTENT) for _ in range(n)]
+
+
+_CONTENTS_LIST = _contents_list()
 
 
 @st.composite
@@ -51,7 +51,7 @@ def union_array_contents_kwargs(
     """Strategy for options for `union_array_contents()` strategy."""
     if chain is None:
         chain = st_ak.OptsChain({})
-    st_contents = chain.register(_contents_list())
+    st_contents = chain.register(_CONTENTS_LIST)
 
     min_length, max_length = draw(st_ak.ranges(min_start=0, max_end=10))
 
@@ -65,7 +65,7 @@ def union_array_contents_kwargs(
             {k: st.just(v) for k, v in drawn if v is not None},
             optional={
                 'contents': st.one_of(
-                    _contents_list(),
+                    _CONTENTS_LIST,
                     st.just(st_contents),
                 ),
                 'max_contents': st.integers(min_value=2, max_value=10),
@@ -113,18 +113,14 @@ def test_properties(data: st.DataObject) -> None:
     # Tags validity: dtype is int8, values in [0, len(contents))
     tags = result.tags.data
     assert tags.dtype == np.int8
-    assert np.all(tags >= 0)
-    assert np.all(tags < len(result.contents))
+    assert len(tags) == 0 or 0 <= tags.min() <= tags.max() < len(result.contents)
 
     # Index validity: dtype in {int32, uint32, int64}, values in valid range
     index = result.index.data
     assert index.dtype in (np.int32, np.uint32, np.int64)
-    for tag_val in range(len(result.contents)):
-        content_len = len(result.contents[tag_val])
-        indices_for_tag = index[tags == tag_val]
-        if len(indices_for_tag) > 0:
-            assert np.all(indices_for_tag >= 0)
-            assert np.all(indices_for_tag < content_len)
+    content_lens = np.array([len(c) for c in result.contents])
+    assert len(index) == 0 or index.min() >= 0
+    assert np.all(index < content_lens[tags])
 
     # Length: tags and index have the same length
     assert len(tags) == len(index)
@@ -133,11 +129,12 @@ def test_properties(data: st.DataObject) -> None:
     # Compact indexing holds unless max_length is given
     max_length = opts.kwargs.get('max_length')
     if max_length is None:
-        for tag_val in range(len(result.contents)):
-            indices_for_tag = index[tags == tag_val]
-            content_len = len(result.contents[tag_val])
-            assert len(indices_for_tag) == content_len
-            assert set(indices_for_tag.tolist()) == set(range(content_len))
+        # Each content element is referenced exactly once
+        counts = np.bincount(tags, minlength=len(result.contents))
+        assert np.array_equal(counts, content_lens)
+        order = np.lexsort((index, tags))
+        expected = np.concatenate([np.arange(n) for n in content_lens])
+        assert np.array_equal(index[order], expected)
 
     # Assert length is within bounds
     min_length = opts.kwargs.get('min_length', 0)
@@ -158,11 +155,16 @@ def test_draw_different_content_lengths() -> None:
     """Assert the contents can have different lengths."""
     find(
         st_ak.contents.union_array_contents(),
-        lambda u: len({len(c) for c in u.contents}) > 1,
+        _has_different_content_lengths,
         settings=FIND,
     )
 
 
+def _has_different_content_lengths(u: UnionArray) -> bool:
+    lengths = [len(c) for c in u.contents]
+    return min(lengths) != max(lengths)
+
+
 @pytest.mark.parametrize('min_length', [1, 2, 10])
 def test_draw_min_length(min_length: int) -> None:
     """Assert the length can reach `min_length`."""
@@ -215,14 +217,14 @@ def test_draw_from_contents_nested_union() -> None:
 
 
 def _has_nested_union(c: Content) -> bool:
-    for node in iter_contents(c):
-        if not isinstance(node, UnionArray):
-            continue
-        # Check if any descendant is a UnionArray
-        for child in node.contents:
-            for descendant in iter_contents(child):
-                if isinstance(descendant, UnionArray):
-                    return True
+    # Walk the tree once, carrying whether any ancestor is a UnionArray
+    stack = [(c, False)]
+    while stack:
+        node, under_union = stack.pop()
+        is_union = isinstance(node, UnionArray)
+        if is_union and under_union:
+            return True
+        stack.extend((child, under_union or is_union) for child in get_contents(node))
     return False
 
 
@@ -240,14 +242,18 @@ def test_draw_from_contents_option_deep_inside_union() -> None:
 
 
 def _has_option_deep_inside_union(c: Content) -> bool:
-    for node in iter_contents(c):
-        if not isinstance(node, UnionArray):
-            continue
-        for child in node.contents:
-            if child.is_option:
-                continue
-            if any(d.is_option for d in iter_contents(child)):
-                return True
+    # Walk the tree once, carrying whether any ancestor is a non-option child
+    # of a UnionArray
+    stack = [(c, False)]
+    while stack:
+        node, in_branch = stack.pop()
+        if in_branch and node.is_option:
+            return True
+        is_union = isinstance(node, UnionArray)
+        stack.extend(
+            (child, in_branch or (is_union and not child.is_option))
+            for child in get_contents(node)
+        )
     return False
 
 
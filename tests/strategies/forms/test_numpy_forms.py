@@ -6,9 +6,25 @@ from hypothesis import strategies as st
 
 import awkward as ak
 from hypothesis_awkward import strategies as st_ak
-from hypothesis_awkward.util import SUPPORTED_DTYPE_NAMES
+from hypothesis_awkward.util import SUPPORTED_DTYPE_NAMES, SUPPORTED_DTYPES
 from tests.find_settings import FIND_NO_SHRINK
 
+_NUMPY_TYPES = st_ak.numpy_types()
+_SUPPORTED_DTYPES = st_ak.supported_dtypes()
+
+
+def _inner_shapes(min_size: int) -> st.SearchStrategy[tuple[int, ...]]:
+    """Strategy for generating small inner_shape tuples."""
+    return st.lists(
+        st.integers(min_value=1, max_value=5),
+        min_size=min_size,
+        max_size=3,
+    ).map(tuple)
+
+
+_INNER_SHAPES = _inner_shapes(min_size=0)
+_NONEMPTY_INNER_SHAPES = _inner_shapes(min_size=1)
+
 
 class NumpyFormsKwargs(TypedDict, total=False):
     """Options for `numpy_forms()` strategy."""
@@ -20,15 +36,6 @@ class NumpyFormsKwargs(TypedDict, total=False):
     allow_inner_shape: bool
 
 
-def _inner_shape_strategies() -> st.SearchStrategy[tuple[int, ...]]:
-    """Strategy for generating small inner_shape tuples."""
-    return st.lists(
-        st.integers(min_value=1, max_value=5),
-        min_size=1,
-        max_size=3,
-    ).map(tuple)
-
-
 @st.composite
 def numpy_forms_kwargs(
     draw: st.DrawFn,
@@ -42,15 +49,15 @@ def numpy_forms_kwargs(
     """
     if chain is None:
         chain = st_ak.OptsChain({})
-    st_type = chain.register(st_ak.numpy_types())
-    st_dtypes = chain.register(st_ak.supported_dtypes())
-    st_inner_shape = chain.register(_inner_shape_strategies())
+    st_type = chain.register(_NUMPY_TYPES)
+    st_dtypes = chain.register(_SUPPORTED_DTYPES)
+    st_inner_shape = chain.register(_NONEMPTY_INNER_SHAPES)
 
     def type_mode() -> st.SearchStrategy[NumpyFormsKwargs]:
         return st.fixed_dictionaries(
             {
                 'type_': st.one_of(
-                    st_ak.numpy_types(),
+                    _NUMPY_TYPES,
                     st.just(st_type),
                 ),
             },
@@ -67,11 +74,7 @@ def numpy_forms_kwargs(
                 'allow_datetime': st.booleans(),
                 'inner_shape': st.one_of(
                     st.none(),
-                    st.lists(
-                        st.integers(min_value=1, max_value=5),
-                        min_size=0,
-                        max_size=3,
-                    ).map(tuple),
+                    _INNER_SHAPES,
                     st.just(st_inner_shape),
                 ),
                 'allow_inner_shape': st.booleans(),
@@ -82,9 +85,9 @@ def numpy_forms_kwargs(
     return chain.extend(kwargs)
 
 
-DATETIME_PRIMITIVES = frozenset(
-    n for n in SUPPORTED_DTYPE_NAMES if n.startswith(('datetime64', 'timedelta64'))
-)
+DATETIME_PRIMITIVES = frozenset(d.name for d in SUPPORTED_DTYPES if d.kind in 'Mm')
+DATETIME64_PRIMITIVES = frozenset(d.name for d in SUPPORTED_DTYPES if d.kind == 'M')
+INTEGER_PRIMITIVES = frozenset(d.name for d in SUPPORTED_DTYPES if d.kind == 'i')
 
 
 @given(data=st.data())
@@ -156,7 +159,7 @@ def test_draw_datetime_primitive() -> None:
     """Assert that datetime64 primitive can be drawn."""
     find(
         st_ak.numpy_forms(),
-        lambda f: f.primitive.startswith('datetime64'),
+        lambda f: f.primitive in DATETIME64_PRIMITIVES,
         settings=FIND_NO_SHRINK,
     )
 
@@ -165,7 +168,7 @@ def test_draw_integer_primitive() -> None:
     """Assert that integer primitives can be drawn."""
     find(
         st_ak.numpy_forms(),
-        lambda f: f.primitive in ('int8', 'int16', 'int32', 'int64'),
+        lambda f: f.primitive in INTEGER_PRIMITIVES,
         settings=FIND_NO_SHRINK,
     )
 
@@ -13,7 +13,7 @@ from hypothesis_awkward.strategies import OptsChain, RecordDraws
 @st.composite
 def draw_opts_chain(
     draw: st.DrawFn,
-) -> tuple[OptsChain[Any], list[OptsChain[Any]]]:
+) -> tuple[OptsChain[Any], list[OptsChain[Any]], list[dict[str, Any]]]:
     """Build a chain of OptsChain produced by repeated extend() calls.
 
     Returns
@@ -22,10 +22,13 @@ def draw_opts_chain(
         The OptsChain after all extend() calls.
     chain : list[OptsChain]
         All OptsChain in the chain, from base (index 0) to final (index -1).
+    levels : list[dict]
+        The kwargs passed to each extend() call, in order.
     """
     depth = draw(st.integers(min_value=0, max_value=4), label='depth')
 
     chain: list[OptsChain[Any]] = []
+    levels: list[dict[str, Any]] = []
     opts: OptsChain[Any] = OptsChain({})
     chain.append(opts)
 
@@ -37,8 +40,9 @@ def draw_opts_chain(
 
         opts = opts.extend(level_kwargs)
         chain.append(opts)
+        levels.append(level_kwargs)
 
-    return opts, chain
+    return opts, chain, levels
 
 
 _VALUE_STRATEGIES: list[st.SearchStrategy[Any]] = [
@@ -50,8 +54,9 @@ _VALUE_STRATEGIES: list[st.SearchStrategy[Any]] = [
     st.tuples(st.integers()),
 ]
 
+_PLAIN_VALUES = st.one_of(*_VALUE_STRATEGIES)
+
 
-@st.composite
 def _draw_value(
     draw: st.DrawFn,
     *,
@@ -67,14 +72,14 @@ def _draw_value(
 
     match kind:
         case 'plain':
-            return draw(st.one_of(*_VALUE_STRATEGIES))
+            return draw(_PLAIN_VALUES)
         case 'strategy':
             strategy = draw(st.sampled_from(_VALUE_STRATEGIES))
             return opts.register(strategy)
         case 'list':
             n = draw(st.integers(min_value=0, max_value=3))
             return [
-                draw(_draw_value(opts=opts, max_depth=max_depth - 1)) for _ in range(n)
+                _draw_value(draw, opts=opts, max_depth=max_depth - 1) for _ in range(n)
             ]
         case 'dict':
             keys = draw(
@@ -86,7 +91,7 @@ def _draw_value(
                 )
             )
             return {
-                k: draw(_draw_value(opts=opts, max_depth=max_depth - 1)) for k in keys
+                k: _draw_value(draw, opts=opts, max_depth=max_depth - 1) for k in keys
             }
         case _:  # pragma: no cover
             raise AssertionError(kind)
@@ -109,19 +114,19 @@ def _level_kwargs(
         label='keys',
     )
 
-    return {key: draw(_draw_value(opts=opts), label=key) for key in keys}
+    return {key: _draw_value(draw, opts=opts) for key in keys}
 
 
 @given(data=st.data())
 def test_opts_chain(data: st.DataObject) -> None:
     """Test that register(), extend(), and reset() work together."""
-    final, chain = data.draw(draw_opts_chain(), label='opts_chain')
+    final, _, levels = data.draw(draw_opts_chain(), label='opts_chain')
     all_recorders = final.recorders
 
     # 1. kwargs merging: final.kwargs equals the merge of all levels
     expected_kwargs: dict[str, Any] = {}
-    for opts in chain:
-        expected_kwargs.update(opts.kwargs)
+    for level_kwargs in levels:
+        expected_kwargs.update(level_kwargs)
     assert dict(final.kwargs) == expected_kwargs
 
     # 2. register returns RecordDraws
@@ -155,7 +160,7 @@ def test_opts_chain(data: st.DataObject) -> None:
 @given(data=st.data())
 def test_extend_does_not_affect_parent(data: st.DataObject) -> None:
     """Test that resetting child/parent does not affect the other's recorders."""
-    final, chain = data.draw(draw_opts_chain(), label='opts_chain')
+    final, chain, _ = data.draw(draw_opts_chain(), label='opts_chain')
 
     # Need at least depth >= 1 for this test
     if len(chain) < 2:
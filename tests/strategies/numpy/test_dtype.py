@@ -10,6 +10,8 @@ from hypothesis_awkward.util import n_scalars_in, simple_dtype_kinds_in
 from hypothesis_awkward.util import safe_compare as sc
 from tests.find_settings import FIND
 
+_SUPPORTED_DTYPES = st_ak.supported_dtypes()
+
 
 @given(name=st_ak.supported_dtype_names())
 def test_supported_dtype_names(name: str) -> None:
@@ -42,8 +44,8 @@ def numpy_dtypes_kwargs() -> st.SearchStrategy[NumpyDtypesKwargs]:
         optional={
             'dtype': st.one_of(
                 st.none(),
-                st.just(st_ak.supported_dtypes()),
-                st_ak.supported_dtypes(),
+                st.just(_SUPPORTED_DTYPES),
+                _SUPPORTED_DTYPES,
             ),
             'allow_array': st.booleans(),
             'max_size': st.integers(min_value=1, max_value=10),
@@ -7,6 +7,7 @@ from hypothesis import strategies as st
 import awkward as ak
 from hypothesis_awkward import strategies as st_ak
 from hypothesis_awkward.util import (
+    SUPPORTED_DTYPES,
     any_nan_in_awkward_array,
     any_nan_nat_in_awkward_array,
     any_nat_in_awkward_array,
@@ -17,6 +18,11 @@ from tests.find_settings import FIND_NO_SHRINK
 
 DEFAULT_MAX_SIZE = 10
 
+_SUPPORTED_DTYPES = st_ak.supported_dtypes()
+_FLOAT_DTYPES = st.sampled_from([d for d in SUPPORTED_DTYPES if d.kind == 'f'])
+_DATETIME64_DTYPES = st.sampled_from([d for d in SUPPORTED_DTYPES if d.kind == 'M'])
+_TIMEDELTA64_DTYPES = st.sampled_from([d for d in SUPPORTED_DTYPES if d.kind == 'm'])
+
 
 class FromNumpyKwargs(TypedDict, total=False):
     """Options for `from_numpy()` strategy."""
@@ -36,7 +42,7 @@ def from_numpy_kwargs(
     """Strategy for options for `from_numpy()` strategy."""
     if chain is None:
         chain = st_ak.OptsChain({})
-    st_dtypes = chain.register(st_ak.supported_dtypes())
+    st_dtypes = chain.register(_SUPPORTED_DTYPES)
 
     kwargs = draw(
         st.fixed_dictionaries(
@@ -45,7 +51,7 @@ def from_numpy_kwargs(
                 'dtype': st.one_of(
                     st.none(),
                     st.just(st_dtypes),
-                    st_ak.supported_dtypes(),
+                    _SUPPORTED_DTYPES,
                 ),
                 'allow_structured': st.booleans(),
                 'allow_nan': st.booleans(),
@@ -76,11 +82,10 @@ def test_properties(data: st.DataObject) -> None:
     regulararray = opts.kwargs.get('regulararray', None)
     max_size = opts.kwargs.get('max_size', DEFAULT_MAX_SIZE)
 
-    dtypes = _leaf_dtypes(a)
+    dtypes, size, has_regular_array = _summarize(a)
     structured = _is_structured(a)
     has_nan = any_nan_nat_in_awkward_array(a)
     multi_dimensional = a.ndim > 1
-    size = _size(a)
 
     match dtype:
         case None:
@@ -100,9 +105,9 @@ def test_properties(data: st.DataObject) -> None:
 
     if multi_dimensional and regulararray is not None:
         if regulararray:
-            assert _has_regular_array(a)
+            assert has_regular_array
         else:
-            assert not _has_regular_array(a)
+            assert not has_regular_array
 
     assert size <= max_size
 
@@ -118,9 +123,8 @@ def test_draw_structured() -> None:
 
 def test_draw_nan() -> None:
     """Assert that arrays with NaN can be drawn when allowed."""
-    floating_dtypes = st_ak.supported_dtypes().filter(lambda d: d.kind == 'f')
     find(
-        st_ak.from_numpy(dtype=floating_dtypes, allow_nan=True),
+        st_ak.from_numpy(dtype=_FLOAT_DTYPES, allow_nan=True),
         any_nan_in_awkward_array,
         settings=FIND_NO_SHRINK,
     )
@@ -128,9 +132,8 @@ def test_draw_nan() -> None:
 
 def test_draw_nat_datetime64() -> None:
     """Assert that datetime64 arrays with NaT can be drawn when allowed."""
-    datetime64_dtypes = st_ak.supported_dtypes().filter(lambda d: d.kind == 'M')
     find(
-        st_ak.from_numpy(dtype=datetime64_dtypes, allow_nan=True),
+        st_ak.from_numpy(dtype=_DATETIME64_DTYPES, allow_nan=True),
         any_nat_in_awkward_array,
         settings=FIND_NO_SHRINK,
     )
@@ -138,9 +141,8 @@ def test_draw_nat_datetime64() -> None:
 
 def test_draw_nat_timedelta64() -> None:
     """Assert that timedelta64 arrays with NaT can be drawn when allowed."""
-    timedelta64_dtypes = st_ak.supported_dtypes().filter(lambda d: d.kind == 'm')
     find(
-        st_ak.from_numpy(dtype=timedelta64_dtypes, allow_nan=True),
+        st_ak.from_numpy(dtype=_TIMEDELTA64_DTYPES, allow_nan=True),
         any_nat_in_awkward_array,
         settings=FIND_NO_SHRINK,
     )
@@ -169,9 +171,18 @@ def test_draw_max_size() -> None:
     )
 
 
-def _leaf_dtypes(a: ak.Array) -> set[np.dtype]:
-    """Dtypes of leaf NumPy arrays contained in `a`."""
-    return {arr.dtype for arr in iter_numpy_arrays(a)}
+def _summarize(a: ak.Array) -> tuple[set[np.dtype], int, bool]:
+    """Leaf dtypes, total leaf size, and RegularArray presence in one layout walk."""
+    dtypes = set[np.dtype]()
+    size = 0
+    has_regular_array = False
+    for n in iter_contents(a):
+        if isinstance(n, ak.contents.NumpyArray):
+            dtypes.add(n.data.dtype)
+            size += n.data.size
+        elif isinstance(n, ak.contents.RegularArray):
+            has_regular_array = True
+    return dtypes, size, has_regular_array
 
 
 def _is_structured(a: ak.Array) -> bool:
@@ -183,11 +194,6 @@ def _is_structured(a: ak.Array) -> bool:
     return True
 
 
-def _has_regular_array(a: ak.Array) -> bool:
-    """Check if any content in the layout tree is a RegularArray."""
-    return any(isinstance(n, ak.contents.RegularArray) for n in iter_contents(a))
-
-
 def _size(a: ak.Array) -> int:
     """Total size of all leaf NumPy arrays contained in `a`."""
     return sum(arr.size for arr in iter_numpy_arrays(a))
@@ -1,4 +1,3 @@
-import math
 from typing import Any, TypedDict, cast
 
 import numpy as np
@@ -10,6 +9,7 @@ from hypothesis.extra import numpy as st_np
 import awkward as ak
 from hypothesis_awkward import strategies as st_ak
 from hypothesis_awkward.util import (
+    SUPPORTED_DTYPES,
     any_nan_in_numpy_array,
     any_nan_nat_in_numpy_array,
     any_nat_in_numpy_array,
@@ -21,6 +21,9 @@ from tests.find_settings import FIND_NO_SHRINK
 
 DEFAULT_MAX_SIZE = 10
 
+_SUPPORTED_DTYPES = st_ak.supported_dtypes()
+_NON_BOOL_DTYPES = st.sampled_from([d for d in SUPPORTED_DTYPES if d.kind != 'b'])
+
 
 class NumpyArraysKwargs(TypedDict, total=False):
     """Options for `numpy_arrays()` strategy."""
@@ -50,9 +53,9 @@ def numpy_arrays_kwargs(
     )
     unique = draw(st_ak.none_or(st.booleans()))
 
-    st_dtypes = st_ak.supported_dtypes()
+    st_dtypes = _SUPPORTED_DTYPES
     if unique and not sc(min_size) <= 2:
-        st_dtypes = st_dtypes.filter(lambda d: d.kind != 'b')
+        st_dtypes = _NON_BOOL_DTYPES
     registered_st_dtypes = chain.register(st_dtypes)
     dtype = draw(st.one_of(st.none(), st.just(registered_st_dtypes), st_dtypes))
 
@@ -123,7 +126,7 @@ def test_properties(data: st.DataObject) -> None:
             result_kinds = simple_dtype_kinds_in(n.dtype)
             assert result_kinds <= drawn_kinds
 
-    n_scalars = math.prod(n.shape) * n_scalars_in(n.dtype)
+    n_scalars = n.size * n_scalars_in(n.dtype)
     assert min_size <= n_scalars <= max_size
 
     structured = n.dtype.names is not None
@@ -159,19 +162,6 @@ def test_properties(data: st.DataObject) -> None:
     # Test if the Awkward Array is converted back to a NumPy array with the identical
     # values. The conversion of structured arrays fails under a known condition.
     # Structured arrays may not result in identical values.
-
-    def _is_numpy_convertible(a: ak.Array) -> bool:
-        """True if `a.to_numpy()` is expected to work without error.
-
-        `to_numpy()` fails for structured arrays with non-1D fields
-        https://github.com/scikit-hep/awkward/issues/3690
-        """
-        layout = a.layout
-        if isinstance(layout, ak.contents.NumpyArray):  # simple array
-            return True
-        assert isinstance(layout, ak.contents.RecordArray)  # structured array
-        return all(len(c.shape) == 1 for c in layout.contents)
-
     if _is_numpy_convertible(a):
         to_numpy = a.to_numpy()
         if not has_nan:
@@ -185,6 +175,19 @@ def test_properties(data: st.DataObject) -> None:
             a.to_numpy()
 
 
+def _is_numpy_convertible(a: ak.Array) -> bool:
+    """True if `a.to_numpy()` is expected to work without error.
+
+    `to_numpy()` fails for structured arrays with non-1D fields
+    https://github.com/scikit-hep/awkward/issues/3690
+    """
+    layout = a.layout
+    if isinstance(layout, ak.contents.NumpyArray):  # simple array
+        return True
+    assert isinstance(layout, ak.contents.RecordArray)  # structured array
+    return all(len(c.shape) == 1 for c in layout.contents)
+
+
 def test_draw_structured() -> None:
     """Assert that structured arrays can be drawn by default."""
     find(
@@ -223,9 +226,7 @@ def test_draw_nat_timedelta64() -> None:
 
 def test_draw_empty() -> None:
     """Assert that empty arrays can be drawn by default."""
-    find(
-        st_ak.numpy_arrays(), lambda a: math.prod(a.shape) == 0, settings=FIND_NO_SHRINK
-    )
+    find(st_ak.numpy_arrays(), lambda a: a.size == 0, settings=FIND_NO_SHRINK)
 
 
 @pytest.mark.parametrize('max_dims', [1, None])
@@ -239,7 +240,7 @@ def test_draw_empty_parametrized(
         st_ak.numpy_arrays(
             max_dims=max_dims, max_size=max_size, allow_structured=allow_structured
         ),
-        lambda a: math.prod(a.shape) == 0,
+        lambda a: a.size == 0,
         settings=FIND_NO_SHRINK,
     )
 
@@ -248,7 +249,7 @@ def test_draw_max_size() -> None:
     """Assert that arrays with exactly max_size scalars can be drawn."""
     find(
         st_ak.numpy_arrays(allow_structured=False),
-        lambda a: math.prod(a.shape) == DEFAULT_MAX_SIZE,
+        lambda a: a.size == DEFAULT_MAX_SIZE,
         settings=FIND_NO_SHRINK,
     )
 
@@ -258,7 +259,7 @@ def test_draw_max_size_structured() -> None:
     find(
         st_ak.numpy_arrays(),
         lambda a: (
-            math.prod(a.shape) * n_scalars_in(a.dtype) == DEFAULT_MAX_SIZE
+            a.size * n_scalars_in(a.dtype) == DEFAULT_MAX_SIZE
             and a.dtype.names is not None
         ),
         settings=FIND_NO_SHRINK,
@@ -269,7 +270,7 @@ def test_draw_nonempty_max_size_1() -> None:
     """Assert that a non-empty array can be drawn with max_size=1."""
     find(
         st_ak.numpy_arrays(allow_structured=False, max_size=1),
-        lambda a: math.prod(a.shape) == 1,
+        lambda a: a.size == 1,
         settings=FIND_NO_SHRINK,
     )
 
@@ -279,7 +280,7 @@ def test_draw_min_size() -> None:
     min_size = 5
     find(
         st_ak.numpy_arrays(allow_structured=False, min_size=min_size),
-        lambda a: math.prod(a.shape) == min_size,
+        lambda a: a.size == min_size,
         settings=FIND_NO_SHRINK,
     )
 
@@ -290,8 +291,7 @@ def test_draw_min_size_structured() -> None:
     find(
         st_ak.numpy_arrays(min_size=min_size),
         lambda a: (
-            math.prod(a.shape) * n_scalars_in(a.dtype) == min_size
-            and a.dtype.names is not None
+            a.size * n_scalars_in(a.dtype) == min_size and a.dtype.names is not None
         ),
         settings=FIND_NO_SHRINK,
     )
@@ -8,11 +8,13 @@ import awkward as ak
 from hypothesis_awkward import strategies as st_ak
 from tests.find_settings import FIND_NO_SHRINK
 
+_SUPPORTED_DTYPES = st_ak.supported_dtypes()
+
 
 @given(data=st.data())
 def test_record_draws(data: st.DataObject) -> None:
     """Test that st_ak.RecordDraws records drawn values."""
-    recorder = st_ak.RecordDraws(st_ak.supported_dtypes())
+    recorder = st_ak.RecordDraws(_SUPPORTED_DTYPES)
     n = data.draw(st.integers(min_value=0, max_value=10), label='n')
     expected = []
     for i in range(n):
@@ -34,7 +36,7 @@ def numpy_types_kwargs() -> st.SearchStrategy[NumpyTypesKwargs]:
         optional={
             'dtypes': st.one_of(
                 st.none(),
-                st.just(st_ak.RecordDraws(st_ak.supported_dtypes())),
+                st.just(st_ak.RecordDraws(_SUPPORTED_DTYPES)),
             ),
             'allow_datetime': st.booleans(),
         },
@@ -1,4 +1,5 @@
 import math
+from collections.abc import Iterator
 
 import numpy as np
 from hypothesis import find, given
@@ -74,35 +75,38 @@ def test_draw_nat() -> None:
 
 def _expected_any_nan_nat(a: ak.Array) -> bool:
     """Check if array contains any NaN or NaT."""
-    return _expected_any_nan(a) or _expected_any_nat(a)
+    return any(_any_nan(arr) or _any_nat(arr) for arr in _leaf_arrays(a))
 
 
 def _expected_any_nan(a: ak.Array) -> bool:
     """Check if array contains any NaN."""
-    for content in iter_leaf_contents(a):
-        if not isinstance(content, ak.contents.NumpyArray):
-            continue
-        arr = content.data
-        match arr.dtype.kind:
-            case 'c':
-                if any(
-                    math.isnan(val.real) or math.isnan(val.imag) for val in arr.flat
-                ):
-                    return True
-            case 'f':
-                if any(math.isnan(val) for val in arr.flat):
-                    return True
-    return False
+    return any(_any_nan(arr) for arr in _leaf_arrays(a))
 
 
 def _expected_any_nat(a: ak.Array) -> bool:
     """Check if array contains any NaT."""
+    return any(_any_nat(arr) for arr in _leaf_arrays(a))
+
+
+def _leaf_arrays(a: ak.Array) -> Iterator[np.ndarray]:
+    """Iterate over the data of the leaf NumpyArray contents of `a`."""
     for content in iter_leaf_contents(a):
-        if not isinstance(content, ak.contents.NumpyArray):
-            continue
-        arr = content.data
-        if arr.dtype.kind not in {'m', 'M'}:
-            continue
-        if any(np.isnat(val) for val in arr.flat):
-            return True
+        if isinstance(content, ak.contents.NumpyArray):
+            yield content.data
+
+
+def _any_nan(arr: np.ndarray) -> bool:
+    """Check element by element if `arr` contains any NaN."""
+    match arr.dtype.kind:
+        case 'c':
+            return any(math.isnan(val.real) or math.isnan(val.imag) for val in arr.flat)
+        case 'f':
+            return any(math.isnan(val) for val in arr.flat)
     return False
+
+
+def _any_nat(arr: np.ndarray) -> bool:
+    """Check element by element if `arr` contains any NaT."""
+    if arr.dtype.kind not in {'m', 'M'}:
+        return False
+    return any(np.isnat(val) for val in arr.flat)